@@ -6,6 +6,8 @@ ENVTEST_BIN_DIR="/usr/local/bin/envtest"
 ETCD_PORT="${ETCD_PORT:-2379}"
 API_SERVER_PORT="${API_SERVER_PORT:-6443}"
 KUBECONFIG_PATH="${KUBECONFIG_PATH:-/tmp/kubeconfig}"
+# Server URL written into the kubeconfig, e.g. the host-side address of a fixed port mapping
+EXTERNAL_API_URL="${EXTERNAL_API_URL:-https://localhost:${API_SERVER_PORT}}"
 DATA_DIR="/tmp/envtest"
 CERTS_CONF_DIR="/etc/envtest/certs"
 
@@ -172,7 +174,7 @@ kind: Config
 clusters:
 - cluster:
     certificate-authority-data: ${CA_DATA}
-    server: https://localhost:${API_SERVER_PORT}
+    server: ${EXTERNAL_API_URL}
   name: envtest
 contexts:
 - context:
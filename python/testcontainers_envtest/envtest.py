@@ -2,16 +2,94 @@
 
 from __future__ import annotations
 
-import re
+import contextlib
+import io
+import os
+import tarfile
 import tempfile
-from typing import TYPE_CHECKING
+import threading
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
 
+from docker.errors import APIError, DockerException
 from testcontainers.core.container import DockerContainer
-from testcontainers.core.waiting_utils import wait_for_logs
+from testcontainers.core.exceptions import ContainerStartException
 
 if TYPE_CHECKING:
     from kubernetes import client as k8s_client
 
+# Imported on the first get_kubernetes_client() call: loading the kubernetes
+# client roughly doubles the import time of this package
+_k8s_client: ModuleType | None = None
+_k8s_config: ModuleType | None = None
+_yaml: ModuleType | None = None
+_YamlLoader: Any = None
+
+
+def _import_kubernetes() -> tuple[ModuleType, ModuleType, ModuleType, Any]:
+    """Import the optional kubernetes client once and keep it in the module globals."""
+    global _k8s_client, _k8s_config, _yaml, _YamlLoader
+
+    if _k8s_client is None or _k8s_config is None or _yaml is None:
+        try:
+            from kubernetes import client, config
+        except ImportError as e:  # the optional 'kubernetes' extra is not installed or is broken
+            raise ImportError(
+                "The 'kubernetes' package is required. "
+                "Install it with: pip install testcontainers-envtest[kubernetes]"
+            ) from e
+
+        # Prefer the LibYAML-backed loader when PyYAML was built with it; PyYAML itself
+        # comes in through the kubernetes client, which already imports it
+        _yaml = config.kube_config.yaml
+        _YamlLoader = getattr(_yaml, "CSafeLoader", _yaml.SafeLoader)
+        _k8s_client, _k8s_config = client, config
+
+    return _k8s_client, _k8s_config, _yaml, _YamlLoader
+
+
+_READY_MARKER = b"Envtest is ready!"
+_SERVER_PREFIX = "server: https://"
+_LOCAL_HOSTS = ("localhost:", "127.0.0.1:")
+
+
+def _replace_server_url(kubeconfig: str, api_server_url: str) -> str:
+    """
+    Point every local ``server:`` entry at ``api_server_url``.
+
+    Only the ``https://<localhost|127.0.0.1>:<port>`` prefix of an entry is
+    replaced; anything after the port (a path, a trailing comment) is kept.
+    """
+    # Entries that already point at the target (e.g. EXTERNAL_API_URL was set) are left as is
+    target_address = api_server_url.removeprefix("https://")
+    chunks: list[str] = []
+    copied_to = 0
+    start = kubeconfig.find(_SERVER_PREFIX)
+
+    while start != -1:
+        address_start = start + len(_SERVER_PREFIX)
+        address_end = address_start
+
+        if kubeconfig.startswith(_LOCAL_HOSTS, address_start):
+            port_start = kubeconfig.index(":", address_start) + 1
+            address_end = port_start
+            while address_end < len(kubeconfig) and kubeconfig[address_end].isdecimal():
+                address_end += 1
+
+            address = kubeconfig[address_start:address_end]
+            if address_end > port_start and address != target_address:
+                chunks.append(kubeconfig[copied_to:start])
+                chunks.append(f"server: {api_server_url}")
+                copied_to = address_end
+
+        start = kubeconfig.find(_SERVER_PREFIX, address_end)
+
+    if not chunks:
+        return kubeconfig
+
+    chunks.append(kubeconfig[copied_to:])
+    return "".join(chunks)
+
 
 class EnvtestContainer(DockerContainer):
     """
@@ -51,6 +129,10 @@ class EnvtestContainer(DockerContainer):
         **kwargs: object,
     ) -> None:
         self._kubernetes_version = kubernetes_version or self.DEFAULT_KUBERNETES_VERSION
+        # (container ID, kubeconfig) so a restarted container never sees a stale read
+        self._kubeconfig_cache: tuple[str, str] | None = None
+        self._api_client: k8s_client.ApiClient | None = None
+        self._kubeconfig_path: str | None = None
 
         # Determine the image to use
         if image is None:
@@ -66,9 +148,72 @@ class EnvtestContainer(DockerContainer):
         """Start the envtest container and wait for it to be ready."""
         super().start()
         # Wait for the container to be ready
-        wait_for_logs(self, "Envtest is ready!", timeout=120)
+        self._wait_until_ready(timeout=120)
         return self
 
+    def _wait_until_ready(self, timeout: float) -> None:
+        """
+        Block until the container logs the readiness marker.
+
+        The log stream is followed instead of polled, so readiness is noticed
+        as soon as the marker is flushed and the log is only fetched once.
+        """
+        stream = self.get_wrapped_container().logs(stream=True, follow=True)
+        ready = threading.Event()
+        errors: list[Exception] = []
+
+        def follow_logs() -> None:
+            tail = b""
+            try:
+                for chunk in stream:
+                    # Keep enough of the previous chunk to catch a marker split in two
+                    tail = tail[-len(_READY_MARKER) :] + chunk
+                    if _READY_MARKER in tail:
+                        ready.set()
+                        return
+            except Exception as e:
+                errors.append(e)
+
+        follower = threading.Thread(target=follow_logs, daemon=True)
+        follower.start()
+        follower.join(timeout)
+        # Checked before closing: closing ends the stream cleanly and lets the follower exit
+        timed_out = follower.is_alive()
+
+        if timed_out:
+            # Unblock the follower; streams over SSH can't be cancelled, so it stays parked
+            with contextlib.suppress(DockerException):
+                stream.close()
+
+        if ready.is_set():
+            return
+
+        if errors:
+            raise RuntimeError("Failed to follow the envtest container logs") from errors[0]
+
+        if timed_out:
+            raise TimeoutError(f"Envtest did not become ready within {timeout} seconds")
+
+        raise RuntimeError("Envtest log stream ended before the container became ready")
+
+    def stop(self, force: bool = True, delete_volume: bool = True) -> None:
+        """Stop the envtest container and drop any cached connection details."""
+        api_client, self._api_client = self._api_client, None
+        kubeconfig_path, self._kubeconfig_path = self._kubeconfig_path, None
+        self._kubeconfig_cache = None
+
+        # A failing cleanup step must never leave the container running
+        try:
+            try:
+                if api_client is not None:
+                    api_client.close()
+            finally:
+                if kubeconfig_path is not None:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(kubeconfig_path)
+        finally:
+            super().stop(force=force, delete_volume=delete_volume)
+
     @property
     def kubernetes_version(self) -> str:
         """Return the Kubernetes version of this envtest container."""
@@ -90,50 +235,83 @@ class EnvtestContainer(DockerContainer):
         Get the kubeconfig YAML content for connecting to the API server.
 
         The kubeconfig is modified to use the correct external host and port.
+        It is read from the container once and cached until the container stops.
 
         Returns:
             Kubeconfig YAML string
         """
-        # Read the kubeconfig from the container
-        exit_code, output = self.exec(f"cat {self.KUBECONFIG_PATH}")
-        if exit_code != 0:
-            raise RuntimeError(f"Failed to read kubeconfig: {output}")
+        if self._container is None:
+            raise ContainerStartException(
+                "Container should be started before reading the kubeconfig"
+            )
 
-        kubeconfig = output.decode("utf-8")
+        container_id = self._container.id
+        if self._kubeconfig_cache is not None and self._kubeconfig_cache[0] == container_id:
+            return self._kubeconfig_cache[1]
+
+        # Read the kubeconfig from the container
+        kubeconfig = self._read_file(self.KUBECONFIG_PATH).decode("utf-8")
 
         # Replace the server URL with the external address
         api_server_url = self.get_api_server_url()
-        kubeconfig = re.sub(
-            r"server: https://(?:localhost|127\.0\.0\.1):\d+",
-            f"server: {api_server_url}",
-            kubeconfig,
-        )
+        kubeconfig = _replace_server_url(kubeconfig, api_server_url)
 
+        self._kubeconfig_cache = (container_id, kubeconfig)
         return kubeconfig
 
+    def _read_file(self, path: str) -> bytes:
+        """
+        Read a single file from the container filesystem.
+
+        The file is fetched as a tar archive through the Docker API, so no
+        process has to be spawned inside the container.
+        """
+        try:
+            stream, _ = self.get_wrapped_container().get_archive(path)
+        except APIError as e:
+            raise RuntimeError(f"Failed to read {path}: {e}") from e
+
+        with tarfile.open(fileobj=io.BytesIO(b"".join(stream))) as archive:
+            member = archive.next()
+            content = archive.extractfile(member) if member is not None else None
+            if content is None:
+                raise RuntimeError(f"Failed to read {path}: not a regular file")
+
+            return content.read()
+
     def get_kubeconfig_path(self) -> str:
         """
         Get the kubeconfig written to a temporary file.
 
         This is useful for tools that require a file path rather than the
-        kubeconfig content directly.
+        kubeconfig content directly. The file is written once, reused by
+        subsequent calls, and removed when the container stops.
 
         Returns:
             Path to a temporary file containing the kubeconfig
         """
+        if self._kubeconfig_path is not None and os.path.exists(self._kubeconfig_path):
+            return self._kubeconfig_path
+
         kubeconfig = self.get_kubeconfig()
 
-        # Write to a temporary file
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".kubeconfig", delete=False
-        ) as f:
-            f.write(kubeconfig)
-            return f.name
+        # Write to a temporary file straight through the raw descriptor
+        fd, path = tempfile.mkstemp(suffix=".kubeconfig")
+        try:
+            os.write(fd, kubeconfig.encode("utf-8"))
+        finally:
+            os.close(fd)
+
+        self._kubeconfig_path = path
+        return path
 
     def get_kubernetes_client(self) -> k8s_client.ApiClient:
         """
         Get a configured Kubernetes API client.
 
+        The client is created once and shared by subsequent calls, so its
+        connection pool is reused. It is closed when the container stops.
+
         Requires the 'kubernetes' package to be installed:
             pip install testcontainers-envtest[kubernetes]
 
@@ -143,23 +321,17 @@ class EnvtestContainer(DockerContainer):
         Raises:
             ImportError: If the kubernetes package is not installed
         """
-        try:
-            from kubernetes import client as k8s_client
-            from kubernetes import config as k8s_config
-        except ImportError as e:
-            raise ImportError(
-                "The 'kubernetes' package is required. "
-                "Install it with: pip install testcontainers-envtest[kubernetes]"
-            ) from e
+        if self._api_client is not None:
+            return self._api_client
 
-        kubeconfig = self.get_kubeconfig()
+        client, config, yaml, yaml_loader = _import_kubernetes()
 
-        # Load the kubeconfig from a string
-        loader = k8s_config.kube_config.KubeConfigLoader(
-            config_dict=k8s_config.kube_config.yaml.safe_load(kubeconfig)
+        loader = config.kube_config.KubeConfigLoader(
+            config_dict=yaml.load(self.get_kubeconfig(), Loader=yaml_loader)
         )
 
-        configuration = k8s_client.Configuration()
+        configuration = client.Configuration()
         loader.load_and_set(configuration)
 
-        return k8s_client.ApiClient(configuration)
+        self._api_client = client.ApiClient(configuration)
+        return self._api_client
@@ -1,9 +1,12 @@
 """Pytest configuration and fixtures."""
 
 import os
+import uuid
 
 import pytest
 
+from testcontainers_envtest import EnvtestContainer
+
 
 def pytest_configure(config):
     """Configure pytest markers."""
@@ -19,3 +22,42 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if "integration" in item.keywords:
                 item.add_marker(skip_integration)
+
+
+@pytest.fixture(scope="module")
+def unstarted_container(request):
+    """Build an EnvtestContainer without starting it, shared within a test module.
+
+    Pass constructor arguments through indirect parametrization; each distinct
+    parameter set is built once per module.
+    """
+    return EnvtestContainer(**getattr(request, "param", {}))
+
+
+@pytest.fixture(scope="session")
+def envtest_container():
+    """Create a shared envtest container for the whole test session.
+
+    Under pytest-xdist every worker gets its own container, named after the
+    worker so parallel runs are easy to tell apart.
+
+    If ENVTEST_IMAGE environment variable is set, uses that image for testing.
+    """
+    image = os.environ.get("ENVTEST_IMAGE")
+    kwargs = {"image": image} if image else {}
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    container = EnvtestContainer(**kwargs).with_name(
+        f"envtest-{worker}-{uuid.uuid4().hex[:8]}"
+    )
+    with container:
+        yield container
+
+
+@pytest.fixture
+def resource_name():
+    """Provide a unique name for a test-created resource.
+
+    Unique names keep tests independent without deleting what they create;
+    everything goes away with the session container.
+    """
+    return f"test-{uuid.uuid4().hex[:8]}"
@@ -1,22 +1,13 @@
 """Integration tests for the EnvtestContainer (require Docker)."""
 
 import os
+import re
 
 import pytest
 
 from testcontainers_envtest import EnvtestContainer
 
-
-@pytest.fixture(scope="module")
-def envtest_container():
-    """Create a shared envtest container for all tests in this module.
-
-    If ENVTEST_IMAGE environment variable is set, uses that image for testing.
-    """
-    image = os.environ.get("ENVTEST_IMAGE")
-    kwargs = {"image": image} if image else {}
-    with EnvtestContainer(**kwargs) as container:
-        yield container
+_VERSION_RE = re.compile(r"^\d+\.\d+\.\d+$")
 
 
 @pytest.mark.integration
@@ -53,14 +44,17 @@ class TestEnvtestContainer:
         # The kubeconfig should contain the external API URL
         assert api_url in kubeconfig
 
+    def test_get_kubeconfig_is_cached(self, envtest_container: EnvtestContainer) -> None:
+        """Test that repeated calls reuse the kubeconfig read from the container."""
+        assert envtest_container.get_kubeconfig() is envtest_container.get_kubeconfig()
+
     def test_kubernetes_version(self, envtest_container: EnvtestContainer) -> None:
         """Test that the kubernetes version is returned correctly."""
         version = envtest_container.kubernetes_version
 
         assert version is not None
         # Version should match the expected pattern (e.g., 1.35.0)
-        import re
-        assert re.match(r"^\d+\.\d+\.\d+$", version), f"Invalid version format: {version}"
+        assert _VERSION_RE.match(version), f"Invalid version format: {version}"
 
     def test_get_kubernetes_client(self, envtest_container: EnvtestContainer) -> None:
         """Test that we can get a working Kubernetes client."""
@@ -81,7 +75,19 @@ class TestEnvtestContainer:
         namespace_names = [ns.metadata.name for ns in namespaces.items]
         assert "default" in namespace_names
 
-    def test_create_namespace(self, envtest_container: EnvtestContainer) -> None:
+    def test_get_kubernetes_client_is_cached(
+        self, envtest_container: EnvtestContainer
+    ) -> None:
+        """Test that repeated calls share one API client and connection pool."""
+        api_client = envtest_container.get_kubernetes_client()
+
+        assert envtest_container.get_kubernetes_client() is api_client
+
+    def test_create_namespace(
+        self,
+        envtest_container: EnvtestContainer,
+        resource_name: str,
+    ) -> None:
         """Test that we can create a namespace using the client."""
         from kubernetes import client
 
@@ -90,20 +96,21 @@ class TestEnvtestContainer:
 
         # Create a test namespace
         namespace = client.V1Namespace(
-            metadata=client.V1ObjectMeta(name="test-namespace")
+            metadata=client.V1ObjectMeta(name=resource_name)
         )
 
         created = v1.create_namespace(body=namespace)
-        assert created.metadata.name == "test-namespace"
+        assert created.metadata.name == resource_name
 
         # Verify the namespace exists
-        got = v1.read_namespace(name="test-namespace")
-        assert got.metadata.name == "test-namespace"
+        got = v1.read_namespace(name=resource_name)
+        assert got.metadata.name == resource_name
 
-        # Clean up
-        v1.delete_namespace(name="test-namespace")
-
-    def test_create_and_get_configmap(self, envtest_container: EnvtestContainer) -> None:
+    def test_create_and_get_configmap(
+        self,
+        envtest_container: EnvtestContainer,
+        resource_name: str,
+    ) -> None:
         """Test that we can create and retrieve a ConfigMap."""
         from kubernetes import client
 
@@ -112,22 +119,23 @@ class TestEnvtestContainer:
 
         # Create a ConfigMap
         configmap = client.V1ConfigMap(
-            metadata=client.V1ObjectMeta(name="test-configmap", namespace="default"),
+            metadata=client.V1ObjectMeta(name=resource_name, namespace="default"),
             data={"key1": "value1", "key2": "value2"},
         )
 
         created = v1.create_namespaced_config_map(namespace="default", body=configmap)
-        assert created.metadata.name == "test-configmap"
+        assert created.metadata.name == resource_name
 
         # Retrieve the ConfigMap
-        got = v1.read_namespaced_config_map(name="test-configmap", namespace="default")
+        got = v1.read_namespaced_config_map(name=resource_name, namespace="default")
         assert got.data["key1"] == "value1"
         assert got.data["key2"] == "value2"
 
-        # Clean up
-        v1.delete_namespaced_config_map(name="test-configmap", namespace="default")
-
-    def test_create_and_delete_secret(self, envtest_container: EnvtestContainer) -> None:
+    def test_create_and_delete_secret(
+        self,
+        envtest_container: EnvtestContainer,
+        resource_name: str,
+    ) -> None:
         """Test that we can create and delete a Secret."""
         from kubernetes import client
 
@@ -136,19 +144,19 @@ class TestEnvtestContainer:
 
         # Create a Secret
         secret = client.V1Secret(
-            metadata=client.V1ObjectMeta(name="test-secret", namespace="default"),
+            metadata=client.V1ObjectMeta(name=resource_name, namespace="default"),
             string_data={"password": "supersecret"},
         )
 
         created = v1.create_namespaced_secret(namespace="default", body=secret)
-        assert created.metadata.name == "test-secret"
+        assert created.metadata.name == resource_name
 
         # Delete the Secret
-        v1.delete_namespaced_secret(name="test-secret", namespace="default")
+        v1.delete_namespaced_secret(name=resource_name, namespace="default")
 
         # Verify it's deleted
         with pytest.raises(client.exceptions.ApiException) as exc_info:
-            v1.read_namespaced_secret(name="test-secret", namespace="default")
+            v1.read_namespaced_secret(name=resource_name, namespace="default")
         assert exc_info.value.status == 404
 
 
@@ -171,6 +179,10 @@ class TestEnvtestContainerKubeconfigPath:
         assert "apiVersion: v1" in content
         assert "kind: Config" in content
 
+    def test_kubeconfig_path_is_reused(self, envtest_container: EnvtestContainer) -> None:
+        """Test that repeated calls return the same kubeconfig file."""
+        assert envtest_container.get_kubeconfig_path() == envtest_container.get_kubeconfig_path()
+
     def test_kubeconfig_path_is_readable(self, envtest_container: EnvtestContainer) -> None:
         """Test that the kubeconfig file is readable and valid."""
         path = envtest_container.get_kubeconfig_path()
@@ -186,14 +198,16 @@ class TestEnvtestContainerKubeconfigPath:
 class TestEnvtestContainerWithVersion:
     """Unit tests for EnvtestContainer with a specific Kubernetes version."""
 
-    def test_custom_kubernetes_version(self) -> None:
+    @pytest.mark.parametrize(
+        "unstarted_container", [{"kubernetes_version": "1.34.1"}], indirect=True
+    )
+    def test_custom_kubernetes_version(self, unstarted_container: EnvtestContainer) -> None:
         """Test that we can specify a custom Kubernetes version."""
-        container = EnvtestContainer(kubernetes_version="1.34.1")
-
-        assert container.kubernetes_version == "1.34.1"
+        assert unstarted_container.kubernetes_version == "1.34.1"
 
-    def test_default_kubernetes_version(self) -> None:
+    def test_default_kubernetes_version(self, unstarted_container: EnvtestContainer) -> None:
         """Test that the default Kubernetes version is set correctly."""
-        container = EnvtestContainer()
-
-        assert container.kubernetes_version == EnvtestContainer.DEFAULT_KUBERNETES_VERSION
+        assert (
+            unstarted_container.kubernetes_version
+            == EnvtestContainer.DEFAULT_KUBERNETES_VERSION
+        )
@@ -1,8 +1,73 @@
 """Unit tests for EnvtestContainer that don't require Docker."""
 
 import re
-
-from testcontainers_envtest import EnvtestContainer
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from docker.errors import DockerException
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.exceptions import ContainerStartException
+
+from testcontainers_envtest import EnvtestContainer, envtest
+from testcontainers_envtest.envtest import _replace_server_url
+
+_SEMVER_PREFIX_RE = re.compile(r"^\d+\.\d+\.\d+")
+
+_CUSTOM_IMAGE = "my-registry/envtest:custom"
+
+
+class FakeLogStream:
+    """Stand-in for docker-py's CancellableStream, which ends cleanly once closed."""
+
+    def __init__(
+        self,
+        chunks: list[bytes],
+        block: bool = False,
+        error: Exception | None = None,
+        close_error: Exception | None = None,
+    ) -> None:
+        self._chunks = chunks
+        self._block = block
+        self._error = error
+        self._close_error = close_error
+        self._closed = threading.Event()
+        self._drained = threading.Event()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed.is_set()
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._chunks
+            if self._error is not None:
+                raise self._error
+            if self._block:
+                self._closed.wait()
+        finally:
+            self._drained.set()
+
+    def close(self) -> None:
+        if self._close_error is not None:
+            raise self._close_error
+
+        # Like a socket shutdown, closing ends the iteration before returning,
+        # giving the consumer a moment to notice and exit
+        self._closed.set()
+        self._drained.wait(timeout=1)
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def offline_container() -> EnvtestContainer:
+    """Build an EnvtestContainer with a mocked Docker client, so no daemon is needed."""
+    with patch("testcontainers.core.container.DockerClient"):
+        return EnvtestContainer()
 
 
 class TestEnvtestContainerUnit:
@@ -25,44 +90,178 @@ class TestEnvtestContainerUnit:
         """Test that the kubeconfig path is set correctly."""
         assert EnvtestContainer.KUBECONFIG_PATH == "/tmp/kubeconfig"
 
-    def test_default_initialization(self) -> None:
-        """Test container initialization with defaults."""
-        container = EnvtestContainer()
+    @pytest.mark.parametrize(
+        ("unstarted_container", "expected_image", "expected_version"),
+        [
+            pytest.param(
+                {},
+                EnvtestContainer.DEFAULT_IMAGE,
+                EnvtestContainer.DEFAULT_KUBERNETES_VERSION,
+                id="defaults",
+            ),
+            pytest.param(
+                {"kubernetes_version": "1.34.1"},
+                # Should use versioned image tag
+                "ghcr.io/roma-glushko/testcontainers-envtest:v1.34.1",
+                "1.34.1",
+                id="custom-kubernetes-version",
+            ),
+            pytest.param(
+                {"image": _CUSTOM_IMAGE},
+                _CUSTOM_IMAGE,
+                EnvtestContainer.DEFAULT_KUBERNETES_VERSION,
+                id="custom-image",
+            ),
+            pytest.param(
+                # Custom image should be used, but the version should still be reported
+                {"image": _CUSTOM_IMAGE, "kubernetes_version": "1.34.1"},
+                _CUSTOM_IMAGE,
+                "1.34.1",
+                id="custom-image-overrides-version",
+            ),
+        ],
+        indirect=["unstarted_container"],
+    )
+    def test_initialization(
+        self,
+        unstarted_container: EnvtestContainer,
+        expected_image: str,
+        expected_version: str,
+    ) -> None:
+        """Test that the image and Kubernetes version are resolved from init arguments."""
+        assert unstarted_container.image == expected_image
+        assert unstarted_container.kubernetes_version == expected_version
+
+    def test_exposed_ports(self, unstarted_container: EnvtestContainer) -> None:
+        """Test that the API server port is exposed."""
+        # Check that ports contains the API server port (set by with_exposed_ports)
+        assert EnvtestContainer.API_SERVER_PORT in unstarted_container.ports
 
-        assert container.kubernetes_version == EnvtestContainer.DEFAULT_KUBERNETES_VERSION
-        assert container.image == EnvtestContainer.DEFAULT_IMAGE
 
-    def test_custom_kubernetes_version(self) -> None:
-        """Test container initialization with custom Kubernetes version."""
-        container = EnvtestContainer(kubernetes_version="1.34.1")
+class TestNotStarted:
+    """Tests for using a container that hasn't been started."""
 
-        assert container.kubernetes_version == "1.34.1"
-        # Should use versioned image tag
-        assert "v1.34.1" in container.image
+    def test_get_kubeconfig(self, offline_container: EnvtestContainer) -> None:
+        """Test that reading the kubeconfig requires a started container."""
+        with pytest.raises(ContainerStartException):
+            offline_container.get_kubeconfig()
 
-    def test_custom_image(self) -> None:
-        """Test container initialization with custom image."""
-        custom_image = "my-registry/envtest:custom"
-        container = EnvtestContainer(image=custom_image)
+    def test_get_kubernetes_client(self, offline_container: EnvtestContainer) -> None:
+        """Test that building a client requires a started container."""
+        with pytest.raises(ContainerStartException):
+            offline_container.get_kubernetes_client()
 
-        assert container.image == custom_image
 
-    def test_custom_image_overrides_version(self) -> None:
-        """Test that custom image takes precedence over version-based image."""
-        custom_image = "my-registry/envtest:custom"
-        container = EnvtestContainer(image=custom_image, kubernetes_version="1.34.1")
+class TestStop:
+    """Tests for releasing cached state when the container stops."""
 
-        # Custom image should be used, not version-based image
-        assert container.image == custom_image
-        # But kubernetes_version property should still reflect the set version
-        assert container.kubernetes_version == "1.34.1"
+    def test_stop_clears_cached_state(
+        self, offline_container: EnvtestContainer, tmp_path: Path
+    ) -> None:
+        """Test that stop() removes the kubeconfig file and drops every cache."""
+        kubeconfig_path = tmp_path / "envtest.kubeconfig"
+        kubeconfig_path.write_text("apiVersion: v1\n")
+        api_client = MagicMock()
+        offline_container._kubeconfig_path = str(kubeconfig_path)
+        offline_container._api_client = api_client
+        offline_container._kubeconfig_cache = ("container-id", "apiVersion: v1\n")
 
-    def test_exposed_ports(self) -> None:
-        """Test that the API server port is exposed."""
-        container = EnvtestContainer()
+        with patch.object(DockerContainer, "stop") as docker_stop:
+            offline_container.stop()
 
-        # Check that ports contains the API server port (set by with_exposed_ports)
-        assert EnvtestContainer.API_SERVER_PORT in container.ports
+        docker_stop.assert_called_once()
+        api_client.close.assert_called_once()
+        assert not kubeconfig_path.exists()
+        assert offline_container._kubeconfig_path is None
+        assert offline_container._api_client is None
+        assert offline_container._kubeconfig_cache is None
+
+    def test_stop_removes_container_when_cleanup_fails(
+        self, offline_container: EnvtestContainer, tmp_path: Path
+    ) -> None:
+        """Test that the container is stopped even if closing the client fails."""
+        kubeconfig_path = tmp_path / "envtest.kubeconfig"
+        kubeconfig_path.write_text("apiVersion: v1\n")
+        api_client = MagicMock()
+        api_client.close.side_effect = OSError("pool already closed")
+        offline_container._kubeconfig_path = str(kubeconfig_path)
+        offline_container._api_client = api_client
+
+        with patch.object(DockerContainer, "stop") as docker_stop, pytest.raises(OSError):
+            offline_container.stop()
+
+        docker_stop.assert_called_once()
+        assert not kubeconfig_path.exists()
+        assert offline_container._api_client is None
+
+
+class TestKubernetesImport:
+    """Tests for the lazily imported kubernetes client."""
+
+    def test_missing_kubernetes_raises_with_cause(
+        self, offline_container: EnvtestContainer
+    ) -> None:
+        """Test that the install hint keeps the original import failure as its cause."""
+        with (
+            patch.dict(sys.modules, {"kubernetes": None}),
+            patch.object(envtest, "_k8s_client", None),
+            pytest.raises(ImportError, match="pip install testcontainers-envtest") as exc_info,
+        ):
+            offline_container.get_kubernetes_client()
+
+        assert isinstance(exc_info.value.__cause__, ImportError)
+
+
+class TestWaitUntilReady:
+    """Tests for following the container logs until envtest is ready."""
+
+    def _wait(self, container: EnvtestContainer, stream: FakeLogStream, timeout: float) -> None:
+        with patch.object(container, "get_wrapped_container") as wrapped:
+            wrapped.return_value.logs.return_value = stream
+            container._wait_until_ready(timeout=timeout)
+
+    def test_ready(self, offline_container: EnvtestContainer) -> None:
+        """Test that a marker split across chunks is detected."""
+        stream = FakeLogStream([b"Starting etcd...\nEnvtest is ", b"ready!\n"], block=True)
+
+        self._wait(offline_container, stream, timeout=5)
+
+        # Closing is left to the finished follower; it can fail on SSH hosts
+        assert not stream.closed
+
+    def test_follower_error(self, offline_container: EnvtestContainer) -> None:
+        """Test that an error while following the logs is raised as the cause."""
+        error = DockerException("connection reset")
+        stream = FakeLogStream([b"Starting etcd...\n"], error=error)
+
+        with pytest.raises(RuntimeError, match="Failed to follow") as exc_info:
+            self._wait(offline_container, stream, timeout=5)
+
+        assert exc_info.value.__cause__ is error
+
+    def test_timeout(self, offline_container: EnvtestContainer) -> None:
+        """Test that a stalled log stream times out and is closed."""
+        stream = FakeLogStream([b"Starting etcd...\n"], block=True)
+
+        with pytest.raises(TimeoutError):
+            self._wait(offline_container, stream, timeout=0.2)
+
+        assert stream.closed
+
+    def test_timeout_with_uncancellable_stream(self, offline_container: EnvtestContainer) -> None:
+        """Test that a stream that can't be closed (e.g. over SSH) still times out."""
+        close_error = DockerException("Cancellable streams not supported for the SSH protocol")
+        stream = FakeLogStream([b"Starting etcd...\n"], block=True, close_error=close_error)
+
+        with pytest.raises(TimeoutError):
+            self._wait(offline_container, stream, timeout=0.2)
+
+    def test_stream_ended(self, offline_container: EnvtestContainer) -> None:
+        """Test that a log stream ending without the marker fails right away."""
+        stream = FakeLogStream([b"ERROR: etcd failed to start\n"])
+
+        with pytest.raises(RuntimeError, match="ended before"):
+            self._wait(offline_container, stream, timeout=5)
 
 
 class TestKubeconfigParsing:
@@ -77,11 +276,7 @@ clusters:
   name: envtest
 """
         new_url = "https://192.168.1.100:32768"
-        result = re.sub(
-            r"server: https://(?:localhost|127\.0\.0\.1):\d+",
-            f"server: {new_url}",
-            kubeconfig,
-        )
+        result = _replace_server_url(kubeconfig, new_url)
 
         assert new_url in result
         assert "localhost" not in result
@@ -95,11 +290,7 @@ clusters:
   name: envtest
 """
         new_url = "https://host.docker.internal:45678"
-        result = re.sub(
-            r"server: https://(?:localhost|127\.0\.0\.1):\d+",
-            f"server: {new_url}",
-            kubeconfig,
-        )
+        result = _replace_server_url(kubeconfig, new_url)
 
         assert new_url in result
         assert "127.0.0.1" not in result
@@ -113,16 +304,93 @@ clusters:
   name: envtest
 """
         new_url = "https://192.168.1.100:32768"
-        result = re.sub(
-            r"server: https://(?:localhost|127\.0\.0\.1):\d+",
-            f"server: {new_url}",
-            kubeconfig,
-        )
+        result = _replace_server_url(kubeconfig, new_url)
 
         # Original URL should remain unchanged
         assert "kubernetes.default:443" in result
         assert new_url not in result
 
+    def test_replace_keeps_rest_of_line(self) -> None:
+        """Test that only the host:port prefix is replaced, as the original regex did."""
+        kubeconfig = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://localhost:6443/
+  name: envtest
+- cluster:
+    server: https://127.0.0.1:6443  # local
+  name: local
+"""
+        new_url = "https://192.168.1.100:32768"
+        result = _replace_server_url(kubeconfig, new_url)
+
+        assert f"server: {new_url}/\n" in result
+        assert f"server: {new_url}  # local\n" in result
+
+    def test_replace_is_idempotent(self) -> None:
+        """Test that an already rewritten kubeconfig is returned unchanged."""
+        kubeconfig = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://127.0.0.1:6443
+  name: envtest
+"""
+        new_url = "https://localhost:32768"
+        result = _replace_server_url(kubeconfig, new_url)
+
+        assert f"server: {new_url}" in result
+        assert _replace_server_url(result, new_url) is result
+
+    def test_replace_other_entries_when_one_already_matches(self) -> None:
+        """Test that an entry already at the target URL doesn't stop other rewrites."""
+        kubeconfig = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://localhost:6443
+  name: envtest
+- cluster:
+    server: https://localhost:7000
+  name: other
+"""
+        new_url = "https://localhost:6443"
+        result = _replace_server_url(kubeconfig, new_url)
+
+        assert result.count(f"server: {new_url}\n") == 2
+        assert "localhost:7000" not in result
+
+    def test_replace_url_sharing_port_prefix(self) -> None:
+        """Test that a target URL that is a prefix of the current one still rewrites it."""
+        kubeconfig = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://localhost:32768
+  name: envtest
+"""
+        new_url = "https://localhost:3276"
+        result = _replace_server_url(kubeconfig, new_url)
+
+        assert f"server: {new_url}\n" in result
+        assert "localhost:32768" not in result
+
+    def test_replace_only_local_urls(self) -> None:
+        """Test that only local server entries are replaced in multi-cluster kubeconfigs."""
+        kubeconfig = """apiVersion: v1
+clusters:
+- cluster:
+    server: https://localhost:6443
+  name: envtest
+- cluster:
+    server: https://kubernetes.default:443
+  name: remote
+- cluster:
+    server: https://127.0.0.1:6443"""
+        new_url = "https://192.168.1.100:32768"
+        result = _replace_server_url(kubeconfig, new_url)
+
+        assert result.count(f"server: {new_url}") == 2
+        assert "kubernetes.default:443" in result
+        assert result.endswith(f"server: {new_url}")
+
 
 class TestModuleExports:
     """Tests for module exports."""
@@ -140,7 +408,7 @@ class TestModuleExports:
         assert __version__ is not None
         assert isinstance(__version__, str)
         # Should be a valid semver-like version
-        assert re.match(r"^\d+\.\d+\.\d+", __version__)
+        assert _SEMVER_PREFIX_RE.match(__version__)
 
     def test_all_exports(self) -> None:
         """Test that __all__ contains expected exports."""